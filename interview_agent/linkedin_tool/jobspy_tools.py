@@ -7,13 +7,18 @@ directly, without needing an MCP runtime.
 
 from __future__ import annotations
 
+import functools
+import inspect
 import logging
-from typing import Optional
+from typing import TYPE_CHECKING, Callable, Iterator, Optional
 
-import pandas as pd
+from . import search_cache
 
-from jobspy import scrape_jobs
-from jobspy.model import Country
+# pandas and jobspy take several hundred milliseconds to import, so they are
+# imported where they are used rather than when the agent loads this module.
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
 
 logger = logging.getLogger(__name__)
 
@@ -29,13 +34,187 @@ _VALID_SITES = {
     "naukri",
     "bdjobs",
 }
+_VALID_SITES_SORTED = tuple(sorted(_VALID_SITES))
+_DESCRIPTION_LIMIT = 300
+_CACHE_TTL_SECONDS = 6 * 60 * 60
+
+# Columns every listing shows, falling back to "N/A"
+_REQUIRED_COLUMNS = ("title", "company", "location", "site")
+# Columns rendered only when the scraped row has a value for them
+_OPTIONAL_COLUMNS = (
+    "job_type",
+    "date_posted",
+    "min_amount",
+    "max_amount",
+    "job_url",
+    "description",
+    "company_industry",
+    "job_level",
+    "skills",
+    "experience_range",
+    "company_rating",
+)
+# Everything the listings and summary read from a scrape
+_LISTING_COLUMNS = (
+    *_REQUIRED_COLUMNS,
+    *_OPTIONAL_COLUMNS,
+    "currency",
+    "interval",
+    "is_remote",
+)
+# (label, column) pairs rendered as "label: value" around the salary block
+_POSTING_FIELDS = (("Type", "job_type"), ("Posted", "date_posted"))
+_DETAIL_FIELDS = (
+    ("Industry", "company_industry"),
+    ("Level", "job_level"),
+    ("Skills", "skills"),
+    ("Experience", "experience_range"),
+)
+
+
+def _salary_text(optional: pd.DataFrame, has_salary: pd.Series) -> pd.Series:
+    """Format the salary range of every row at once; empty when unknown."""
+    amount = "{:,.0f}".format
+    # Cast to object so columns without any amounts still concatenate
+    # with strings instead of staying float.
+    text = (
+        optional["min_amount"].map(amount, na_action="ignore").astype(object)
+        + " - "
+        + optional["max_amount"].map(amount, na_action="ignore").astype(object)
+        + " "
+        + optional["currency"].fillna("USD").astype(str)
+        + " ("
+        + optional["interval"].fillna("yearly").astype(str)
+        + ")"
+    )
+    return text.where(has_salary, "")
 
 
-def _trim_description(text: str, limit: int = 300) -> str:
-    """Keep descriptions readable by trimming extra text."""
-    return text if len(text) <= limit else f"{text[:limit]}..."
+def _description_text(optional: pd.DataFrame) -> pd.Series:
+    """Trim every description at once to keep listings readable."""
+    description = optional["description"].astype("string")
+    trimmed = description.str.slice(0, _DESCRIPTION_LIMIT)
+    too_long = description.str.len().gt(_DESCRIPTION_LIMIT).fillna(False)
+    return trimmed.where(~too_long, trimmed + "...").fillna("")
 
 
+def _format_row(
+    position: int,
+    values: dict[str, np.ndarray],
+    flags: dict[str, np.ndarray],
+    salary: str,
+    description: str,
+    remote: bool,
+) -> str:
+    """Render one scraped job as a listing block, skipping missing fields."""
+    listing_parts = [
+        f"{position + 1}. {values['title'][position]}",
+        f"Company: {values['company'][position]}",
+        f"Location: {values['location'][position]}",
+        f"Source: {values['site'][position]}",
+    ]
+    for label, column in _POSTING_FIELDS:
+        if flags[column][position]:
+            listing_parts.append(f"{label}: {values[column][position]}")
+    if salary:
+        listing_parts.append(f"Salary: {salary}")
+    if remote:
+        listing_parts.append("Remote work available")
+    if flags["job_url"][position]:
+        listing_parts.append(f"Apply: {values['job_url'][position]}")
+    if description:
+        listing_parts.append(f"Description: {description}")
+    for label, column in _DETAIL_FIELDS:
+        if flags[column][position]:
+            listing_parts.append(f"{label}: {values[column][position]}")
+    if flags["company_rating"][position]:
+        listing_parts.append(f"Company Rating: {values['company_rating'][position]}/5")
+
+    return "\n".join(listing_parts)
+
+
+def _cached_search(func: Callable[..., str]) -> Callable[..., str]:
+    """Serve repeated searches from the search cache instead of re-scraping."""
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs) -> str:
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        params = dict(bound.arguments)
+        params.pop("verbose", None)
+
+        # Searches restricted to recent postings go stale faster.
+        max_age = _CACHE_TTL_SECONDS
+        if params["hours_old"]:
+            max_age = min(max_age, params["hours_old"] * 60 * 60)
+
+        key = search_cache.make_key(params)
+        cached = search_cache.get(key, max_age)
+        if cached is not None:
+            logger.info("Using cached job search for '%s'", params["search_term"])
+            return cached
+
+        result = func(*args, **kwargs)
+        if not result.startswith("Error"):
+            search_cache.put(key, result, prune_after=_CACHE_TTL_SECONDS)
+        return result
+
+    return wrapper
+
+
+def _drop_duplicate_listings(jobs_df: pd.DataFrame) -> pd.DataFrame:
+    """Drop roles posted on several boards, keeping the first occurrence.
+
+    Listings match on case- and whitespace-insensitive title, company and
+    location.  Rows missing a title or company are never treated as
+    duplicates, since unrelated postings often share a bare title.
+    """
+    keys = jobs_df.reindex(columns=["title", "company", "location"]).fillna("")
+    keys = keys.astype(str).apply(lambda column: column.str.strip().str.lower())
+    identifiable = keys["title"].ne("") & keys["company"].ne("")
+    duplicates = keys.duplicated() & identifiable
+    if not duplicates.any():
+        return jobs_df
+
+    logger.info("Dropped %d duplicate job listings", int(duplicates.sum()))
+    return jobs_df[~duplicates].reset_index(drop=True)
+
+
+def _iter_listings(jobs_df: pd.DataFrame) -> Iterator[str]:
+    """Yield the formatted listing block of each scraped job in order."""
+    optional = jobs_df.reindex(columns=list(_LISTING_COLUMNS))
+    present = optional[list(_OPTIONAL_COLUMNS)].notna()
+    has_salary = present["min_amount"] & present["max_amount"]
+
+    required = jobs_df.reindex(columns=list(_REQUIRED_COLUMNS)).fillna("N/A")
+    required = required.astype(str)
+    required["site"] = required["site"].str.title()
+
+    # Plain arrays keep the per-row work to positional reads.
+    values = {column: required[column].to_numpy() for column in _REQUIRED_COLUMNS}
+    values.update(
+        (column, jobs_df[column].to_numpy())
+        for column in _OPTIONAL_COLUMNS
+        if column in jobs_df.columns
+    )
+    flags = {column: present[column].to_numpy() for column in _OPTIONAL_COLUMNS}
+    salaries = _salary_text(optional, has_salary).to_numpy()
+    descriptions = _description_text(optional).to_numpy()
+    remote_flags = optional["is_remote"].eq(True).to_numpy()
+
+    for position in range(len(jobs_df)):
+        yield _format_row(
+            position,
+            values,
+            flags,
+            salaries[position],
+            descriptions[position],
+            remote_flags[position],
+        )
+
+
+@_cached_search
 def scrape_jobs_tool(
     search_term: str,
     *,
@@ -54,15 +233,19 @@ def scrape_jobs_tool(
 ) -> str:
     """Search for jobs using JobSpy and return a formatted summary."""
     logger.info("Starting job search for '%s'", search_term)
-    sites = list(site_name) if site_name is not None else list(_DEFAULT_SITES)
+    # JobSpy only recognises a list of site names, so the default tuple is
+    # converted; caller-supplied lists are passed through as-is.
+    sites = site_name if site_name is not None else list(_DEFAULT_SITES)
 
-    invalid_sites = [site for site in sites if site not in _VALID_SITES]
+    invalid_sites = set(sites).difference(_VALID_SITES)
     if invalid_sites:
         return (
             "Error: invalid site names: "
-            f"{invalid_sites}. Valid sites: {sorted(_VALID_SITES)}"
+            f"{sorted(invalid_sites)}. Valid sites: {list(_VALID_SITES_SORTED)}"
         )
 
+    from jobspy import scrape_jobs
+
     try:
         jobs_df = scrape_jobs(
             site_name=sites,
@@ -84,6 +267,13 @@ def scrape_jobs_tool(
         logger.exception("Error scraping jobs: %s", exc)
         return f"Error scraping jobs: {exc}"
 
+    # JobSpy returns many more columns than are shown; dropping them up front
+    # keeps the deduplication and formatting passes narrow.
+    jobs_df = jobs_df[
+        [column for column in _LISTING_COLUMNS if column in jobs_df.columns]
+    ]
+    jobs_df = _drop_duplicate_listings(jobs_df)
+
     if jobs_df.empty:
         logger.info("No jobs found for '%s'", search_term)
         return (
@@ -91,64 +281,14 @@ def scrape_jobs_tool(
             "Try adjusting your search parameters."
         )
 
-    results_summary = f"Found {len(jobs_df)} jobs for '{search_term}'"
-    if location:
-        results_summary += f" in {location}"
-
-    listings = []
-    for index, (_, job) in enumerate(jobs_df.iterrows(), start=1):
-        listing_parts = [f"{index}. {job.get('title', 'N/A')}"]
-        listing_parts.append(f"Company: {job.get('company', 'N/A')}")
-        listing_parts.append(f"Location: {job.get('location', 'N/A')}")
-        listing_parts.append(f"Source: {job.get('site', 'N/A').title()}")
-
-        if pd.notna(job.get("job_type")):
-            listing_parts.append(f"Type: {job.get('job_type')}")
-        if pd.notna(job.get("date_posted")):
-            listing_parts.append(f"Posted: {job.get('date_posted')}")
-
-        if pd.notna(job.get("min_amount")) and pd.notna(job.get("max_amount")):
-            currency = job.get("currency", "USD")
-            interval = job.get("interval", "yearly")
-            salary_range = (
-                f"{job.get('min_amount'):,.0f} - "
-                f"{job.get('max_amount'):,.0f} {currency} ({interval})"
-            )
-            listing_parts.append(f"Salary: {salary_range}")
-
-        if job.get("is_remote"):
-            listing_parts.append("Remote work available")
-
-        if pd.notna(job.get("job_url")):
-            listing_parts.append(f"Apply: {job.get('job_url')}")
-
-        if pd.notna(job.get("description")):
-            description = _trim_description(str(job.get("description")))
-            listing_parts.append(f"Description: {description}")
-
-        if pd.notna(job.get("company_industry")):
-            listing_parts.append(f"Industry: {job.get('company_industry')}")
-        if pd.notna(job.get("job_level")):
-            listing_parts.append(f"Level: {job.get('job_level')}")
-        if pd.notna(job.get("skills")):
-            listing_parts.append(f"Skills: {job.get('skills')}")
-        if pd.notna(job.get("experience_range")):
-            listing_parts.append(f"Experience: {job.get('experience_range')}")
-        if pd.notna(job.get("company_rating")):
-            listing_parts.append(f"Company Rating: {job.get('company_rating')}/5")
-
-        listings.append("\n".join(listing_parts))
-
     remote_column = jobs_df.get("is_remote")
-    if remote_column is not None:
-        remote_count = int(remote_column.fillna(False).astype(bool).sum())
-    else:
-        remote_count = 0
+    remote_count = int(remote_column.eq(True).sum()) if remote_column is not None else 0
 
+    location_text = f" in {location}" if location else ""
     summary_lines = [
-        results_summary,
+        f"Found {len(jobs_df)} jobs for '{search_term}'{location_text}",
         "",
-        "\n---\n".join(listings),
+        "\n---\n".join(_iter_listings(jobs_df)),
         "",
         "Search Summary",
         f"Total jobs found: {len(jobs_df)}",
@@ -159,14 +299,16 @@ def scrape_jobs_tool(
     min_amounts = jobs_df.get("min_amount")
     max_amounts = jobs_df.get("max_amount")
     if min_amounts is not None and max_amounts is not None:
-        salary_mask = pd.notna(min_amounts) & pd.notna(max_amounts)
-        salary_jobs = jobs_df[salary_mask]
-        if not salary_jobs.empty:
-            avg_min = salary_jobs["min_amount"].mean()
-            avg_max = salary_jobs["max_amount"].mean()
+        salary_mask = min_amounts.notna() & max_amounts.notna()
+        salary_count = int(salary_mask.sum())
+        if salary_count:
+            # mean() skips the NaN left by where(), so no filtered copy of
+            # the DataFrame is needed.
+            avg_min = min_amounts.where(salary_mask).mean()
+            avg_max = max_amounts.where(salary_mask).mean()
             summary_lines.extend(
                 [
-                    f"Jobs with salary info: {len(salary_jobs)}",
+                    f"Jobs with salary info: {salary_count}",
                     f"Average salary range: {avg_min:,.0f} - {avg_max:,.0f}",
                 ]
             )
@@ -175,16 +317,16 @@ def scrape_jobs_tool(
     return "\n".join(summary_lines)
 
 
-def get_supported_countries() -> str:
-    """Return a formatted list of supported countries."""
-    lines = ["Supported Countries for Job Searches", ""]
-
-    for country in Country:
-        country_names = country.value[0]
-        lines.append(f"- {country.name}: {country_names}")
+@functools.cache
+def _build_countries_text() -> str:
+    """Format the countries JobSpy can target."""
+    from jobspy.model import Country
 
-    lines.extend(
+    return "\n".join(
         [
+            "Supported Countries for Job Searches",
+            "",
+            *(f"- {country.name}: {country.value[0]}" for country in Country),
             "",
             "Note: Use one of the identifiers above for the 'country_indeed' parameter.",
             "",
@@ -199,11 +341,10 @@ def get_supported_countries() -> str:
             "- singapore",
         ]
     )
-    return "\n".join(lines)
 
 
-def get_supported_sites() -> str:
-    """Return descriptions for each job board supported by JobSpy."""
+def _build_sites_text() -> str:
+    """Format a description of each job board supported by JobSpy."""
     sites_info = {
         "linkedin": "Professional networking platform with job listings.",
         "indeed": "Large job search engine with broad coverage.",
@@ -230,70 +371,86 @@ def get_supported_sites() -> str:
     return "\n".join(lines)
 
 
+# The help texts are static, so they are built once.  The countries text
+# needs jobspy and is built on first use instead.
+_SUPPORTED_SITES_TEXT = _build_sites_text()
+_JOB_SEARCH_TIPS_TEXT = (
+    "JobSpy Job Search Tips and Best Practices\n\n"
+    "Search Term Optimization\n"
+    "- Be specific: e.g. 'python developer' instead of 'developer'.\n"
+    "- Use quotes for exact phrases such as \"machine learning engineer\".\n"
+    "- Try variations like 'software engineer' or 'software developer'.\n"
+    "- Include technologies: 'React developer', 'AWS engineer'.\n"
+    "- Consider seniority levels: 'senior', 'junior', 'lead'.\n\n"
+    "Location Strategies\n"
+    "- Remote jobs: set is_remote=True or location='Remote'.\n"
+    "- Specific cities: e.g. 'San Francisco, CA' or 'New York, NY'.\n"
+    "- State or country searches: 'California', 'Texas', 'United Kingdom'.\n"
+    "- Run separate searches for multiple locations.\n\n"
+    "Site Selection Guide\n"
+    "- Begin with a couple of reliable sites to validate a search.\n"
+    "- Indeed is reliable with broader coverage.\n"
+    "- LinkedIn offers quality results but strict rate limits.\n"
+    "- ZipRecruiter is strong for US and Canada roles.\n"
+    "- Google rewards very specific search terms.\n\n"
+    "Performance Tips\n"
+    "- Start with 10-20 results and increase only if needed.\n"
+    "- Use hours_old to focus on recent postings (24, 48, 72).\n"
+    "- Enable linkedin_fetch_description only when you need full text.\n"
+    "- Offset helps paginate through large result sets.\n\n"
+    "Advanced Filtering\n"
+    "- job_type supports fulltime, parttime, internship, contract.\n"
+    "- easy_apply filters for quick-apply postings.\n"
+    "- distance sets the search radius for location-based queries.\n"
+    "- country_indeed alters the target market for Indeed and Glassdoor.\n\n"
+    "Common Issues and Fixes\n"
+    "- No results: broaden search terms or choose different sites.\n"
+    "- Rate limiting: reduce results_wanted and add time between runs.\n"
+    "- LinkedIn blocks: lower frequency or rotate proxies.\n"
+    "- Slow searches: disable LinkedIn description fetching.\n\n"
+    "Sample Searches\n"
+    "Remote work:\n"
+    "  search_term='software engineer'\n"
+    "  location='Remote'\n"
+    "  is_remote=True\n"
+    "  site_name=['indeed', 'zip_recruiter']\n\n"
+    "Local jobs:\n"
+    "  search_term='marketing manager'\n"
+    "  location='Austin, TX'\n"
+    "  distance=25\n"
+    "  site_name=['indeed', 'glassdoor']\n\n"
+    "Recent postings:\n"
+    "  search_term='data scientist'\n"
+    "  hours_old=48\n"
+    "  site_name=['linkedin', 'indeed']\n"
+    "  linkedin_fetch_description=True\n\n"
+    "Entry-level focus:\n"
+    "  search_term='junior developer OR entry level programmer'\n"
+    "  job_type='fulltime'\n"
+    "  easy_apply=True\n\n"
+    "Iterative Search Process\n"
+    "1. Start broad with a small set of sites.\n"
+    "2. Review the initial results for signal.\n"
+    "3. Adjust keywords or filters based on what you see.\n"
+    "4. Expand to more sites if coverage looks thin.\n"
+    "5. Compare results across job boards for variety.\n\n"
+    "Happy job hunting!"
+)
+
+
+def get_supported_countries() -> str:
+    """Return a formatted list of supported countries."""
+    return _build_countries_text()
+
+
+def get_supported_sites() -> str:
+    """Return descriptions for each job board supported by JobSpy."""
+    return _SUPPORTED_SITES_TEXT
+
+
 def get_job_search_tips() -> str:
     """Return a collection of suggestions for running effective searches."""
-    return (
-        "JobSpy Job Search Tips and Best Practices\n\n"
-        "Search Term Optimization\n"
-        "- Be specific: e.g. 'python developer' instead of 'developer'.\n"
-        "- Use quotes for exact phrases such as \"machine learning engineer\".\n"
-        "- Try variations like 'software engineer' or 'software developer'.\n"
-        "- Include technologies: 'React developer', 'AWS engineer'.\n"
-        "- Consider seniority levels: 'senior', 'junior', 'lead'.\n\n"
-        "Location Strategies\n"
-        "- Remote jobs: set is_remote=True or location='Remote'.\n"
-        "- Specific cities: e.g. 'San Francisco, CA' or 'New York, NY'.\n"
-        "- State or country searches: 'California', 'Texas', 'United Kingdom'.\n"
-        "- Run separate searches for multiple locations.\n\n"
-        "Site Selection Guide\n"
-        "- Begin with a couple of reliable sites to validate a search.\n"
-        "- Indeed is reliable with broader coverage.\n"
-        "- LinkedIn offers quality results but strict rate limits.\n"
-        "- ZipRecruiter is strong for US and Canada roles.\n"
-        "- Google rewards very specific search terms.\n\n"
-        "Performance Tips\n"
-        "- Start with 10-20 results and increase only if needed.\n"
-        "- Use hours_old to focus on recent postings (24, 48, 72).\n"
-        "- Enable linkedin_fetch_description only when you need full text.\n"
-        "- Offset helps paginate through large result sets.\n\n"
-        "Advanced Filtering\n"
-        "- job_type supports fulltime, parttime, internship, contract.\n"
-        "- easy_apply filters for quick-apply postings.\n"
-        "- distance sets the search radius for location-based queries.\n"
-        "- country_indeed alters the target market for Indeed and Glassdoor.\n\n"
-        "Common Issues and Fixes\n"
-        "- No results: broaden search terms or choose different sites.\n"
-        "- Rate limiting: reduce results_wanted and add time between runs.\n"
-        "- LinkedIn blocks: lower frequency or rotate proxies.\n"
-        "- Slow searches: disable LinkedIn description fetching.\n\n"
-        "Sample Searches\n"
-        "Remote work:\n"
-        "  search_term='software engineer'\n"
-        "  location='Remote'\n"
-        "  is_remote=True\n"
-        "  site_name=['indeed', 'zip_recruiter']\n\n"
-        "Local jobs:\n"
-        "  search_term='marketing manager'\n"
-        "  location='Austin, TX'\n"
-        "  distance=25\n"
-        "  site_name=['indeed', 'glassdoor']\n\n"
-        "Recent postings:\n"
-        "  search_term='data scientist'\n"
-        "  hours_old=48\n"
-        "  site_name=['linkedin', 'indeed']\n"
-        "  linkedin_fetch_description=True\n\n"
-        "Entry-level focus:\n"
-        "  search_term='junior developer OR entry level programmer'\n"
-        "  job_type='fulltime'\n"
-        "  easy_apply=True\n\n"
-        "Iterative Search Process\n"
-        "1. Start broad with a small set of sites.\n"
-        "2. Review the initial results for signal.\n"
-        "3. Adjust keywords or filters based on what you see.\n"
-        "4. Expand to more sites if coverage looks thin.\n"
-        "5. Compare results across job boards for variety.\n\n"
-        "Happy job hunting!"
-    )
+    return _JOB_SEARCH_TIPS_TEXT
 
 
 __all__ = [
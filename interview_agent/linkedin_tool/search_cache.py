@@ -0,0 +1,138 @@
+"""Small TTL cache for job search results.
+
+Scraping several job boards takes seconds to minutes, while agent
+conversations frequently repeat near-identical searches.  Results are kept in
+an in-process LRU and as gzip-compressed JSON files under the user cache
+directory, keyed on a hash of the search parameters.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional
+
+try:  # Optional: orjson encodes and decodes entries considerably faster.
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+_MEMORY_MAXSIZE = 128
+_memory: OrderedDict[str, tuple[float, str]] = OrderedDict()
+_memory_lock = threading.Lock()
+
+
+def cache_dir() -> Path:
+    """Return the directory holding cached search results."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "jobinator"
+
+
+def make_key(params: dict[str, Any]) -> str:
+    """Return a stable hash for a mapping of search parameters."""
+    payload = json.dumps(params, sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def get(key: str, max_age: float) -> Optional[str]:
+    """Return the cached text for ``key`` if it is younger than ``max_age`` seconds."""
+    now = time.time()
+    with _memory_lock:
+        entry = _memory.get(key)
+        if entry is not None:
+            if now - entry[0] < max_age:
+                _memory.move_to_end(key)
+                return entry[1]
+            del _memory[key]
+
+    path = cache_dir() / f"{key}.json.gz"
+    try:
+        if now - path.stat().st_mtime >= max_age:
+            _discard(path)
+            return None
+        with gzip.open(path, "rb") as file:
+            stored = _loads(file.read())
+        timestamp, text = stored["timestamp"], stored["text"]
+    except FileNotFoundError:
+        return None
+    except (OSError, EOFError, ValueError, KeyError, TypeError) as exc:
+        logger.warning("Discarding unreadable cache entry %s: %s", path, exc)
+        _discard(path)
+        return None
+
+    _remember(key, timestamp, text)
+    return text
+
+
+def put(key: str, text: str, prune_after: float) -> None:
+    """Store ``text`` under ``key`` in memory and on disk.
+
+    Files older than ``prune_after`` seconds are removed from the cache
+    directory at the same time, so it does not grow without bound.
+    """
+    timestamp = time.time()
+    _remember(key, timestamp, text)
+
+    directory = cache_dir()
+    entry_path = directory / f"{key}.json.gz"
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file and rename so concurrent readers never see
+        # a partially written entry.
+        fd, tmp_name = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as raw, gzip.open(raw, "wb") as file:
+                file.write(_dumps({"timestamp": timestamp, "text": text}))
+            os.replace(tmp_name, entry_path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+    except OSError as exc:
+        logger.warning("Could not write search cache entry: %s", exc)
+        return
+
+    for path in directory.glob("*.json.gz"):
+        if path == entry_path:
+            continue
+        try:
+            if timestamp - path.stat().st_mtime >= prune_after:
+                _discard(path)
+        except FileNotFoundError:
+            pass
+
+
+def _discard(path: Path) -> None:
+    try:
+        path.unlink(missing_ok=True)
+    except OSError as exc:
+        logger.warning("Could not remove cache entry %s: %s", path, exc)
+
+
+def _dumps(entry: dict[str, Any]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(entry)
+    return json.dumps(entry).encode("utf-8")
+
+
+def _loads(data: bytes) -> dict[str, Any]:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _remember(key: str, timestamp: float, text: str) -> None:
+    with _memory_lock:
+        _memory[key] = (timestamp, text)
+        _memory.move_to_end(key)
+        while len(_memory) > _MEMORY_MAXSIZE:
+            _memory.popitem(last=False)
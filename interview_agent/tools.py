@@ -3,14 +3,22 @@ from google.adk.tools.mcp_tool.mcp_toolset import MCPToolset
 from google.adk.tools.mcp_tool.mcp_session_manager import StdioConnectionParams
 from mcp import StdioServerParameters
 
+# Keyed on (path, mtime, size) so edits to the CV invalidate the entry
+_CV_CACHE: dict[tuple[str, int, int], str] = {}
+
 def read_cv() -> str:
     """Reads the content of a user CV file. Formatted in Markdown.
     Returns content of a file as a string.
     """
     file_path = Path("user_data/cv_markdown.md")
-    with file_path.open("r", encoding="utf-8") as file:
-        text = file.read()
-        return text  
+    stat = file_path.stat()
+    key = (str(file_path), stat.st_mtime_ns, stat.st_size)
+    text = _CV_CACHE.get(key)
+    if text is None:
+        text = file_path.read_text(encoding="utf-8")
+        _CV_CACHE.clear()
+        _CV_CACHE[key] = text
+    return text
 
 def create_mcp_tools():
     filesystem_tools = MCPToolset(
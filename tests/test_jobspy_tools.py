@@ -0,0 +1,249 @@
+import gzip
+import os
+import sys
+import time
+import types
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from interview_agent.linkedin_tool import search_cache
+from interview_agent.linkedin_tool.jobspy_tools import (
+    _drop_duplicate_listings,
+    _iter_listings,
+    scrape_jobs_tool,
+)
+
+
+@pytest.fixture
+def isolated_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.setattr(search_cache, "_memory", search_cache.OrderedDict())
+    return search_cache.cache_dir()
+
+
+@pytest.fixture
+def scrape_calls(monkeypatch):
+    """Replace jobspy with a stub that records each scrape."""
+    calls = []
+
+    def scrape_jobs(**kwargs):
+        calls.append(kwargs)
+        return pd.DataFrame(
+            {"title": ["Engineer"], "company": ["Acme"], "site": ["indeed"]}
+        )
+
+    jobspy = types.SimpleNamespace(scrape_jobs=scrape_jobs)
+    monkeypatch.setitem(sys.modules, "jobspy", jobspy)
+    return calls
+
+
+def _advance_clock(monkeypatch, seconds):
+    now = time.time() + seconds
+    monkeypatch.setattr(search_cache, "time", types.SimpleNamespace(time=lambda: now))
+
+
+@pytest.mark.parametrize(
+    "jobs_df",
+    [
+        pd.DataFrame(
+            {
+                "title": ["Engineer", "Analyst"],
+                "site": ["indeed", "google"],
+                "min_amount": [np.nan, np.nan],
+                "max_amount": [np.nan, np.nan],
+            }
+        ),
+        pd.DataFrame({"title": ["Engineer", "Analyst"], "site": ["indeed", "google"]}),
+    ],
+    ids=["no-salaries", "no-salary-columns"],
+)
+def test_listings_without_salary_data(jobs_df):
+    listings = list(_iter_listings(jobs_df))
+
+    assert [listing.splitlines()[0] for listing in listings] == [
+        "1. Engineer",
+        "2. Analyst",
+    ]
+    assert not any("Salary:" in listing for listing in listings)
+
+
+
+def test_drop_duplicate_listings(caplog):
+    jobs_df = pd.DataFrame(
+        {
+            "title": [
+                "Software Engineer",
+                " software engineer ",
+                "Software Engineer",
+                "Software Engineer",
+                None,
+                None,
+            ],
+            "company": ["Acme", "ACME", "Globex", None, "Acme", "Acme"],
+            "location": ["Amsterdam", "amsterdam ", "Amsterdam", None, None, None],
+            "site": ["indeed", "google", "glassdoor", "google", "bayt", "naukri"],
+        }
+    )
+
+    with caplog.at_level("INFO"):
+        deduped = _drop_duplicate_listings(jobs_df)
+
+    # Only the case/whitespace variant of the first row is dropped; rows
+    # missing a title or company are always kept.
+    assert deduped["site"].tolist() == [
+        "indeed",
+        "glassdoor",
+        "google",
+        "bayt",
+        "naukri",
+    ]
+    assert deduped.index.tolist() == list(range(5))
+    assert "Dropped 1 duplicate job listings" in caplog.text
+
+
+def test_drop_duplicate_listings_keeps_listings_without_company():
+    jobs_df = pd.DataFrame({"title": ["Software Engineer"] * 2, "site": ["google"] * 2})
+
+    assert _drop_duplicate_listings(jobs_df) is jobs_df
+
+
+def test_repeated_search_is_served_from_cache(isolated_cache, scrape_calls):
+    first = scrape_jobs_tool("engineer", site_name=["indeed"])
+    second = scrape_jobs_tool("engineer", site_name=["indeed"])
+
+    assert second == first
+    assert len(scrape_calls) == 1
+    assert len(list(isolated_cache.glob("*.json.gz"))) == 1
+
+
+def test_verbose_is_not_part_of_the_cache_key(isolated_cache, scrape_calls):
+    scrape_jobs_tool("engineer", site_name=["indeed"], verbose=0)
+    scrape_jobs_tool("engineer", site_name=["indeed"], verbose=2)
+
+    assert len(scrape_calls) == 1
+
+
+@pytest.mark.parametrize(
+    ("hours_old", "elapsed_hours", "expected_scrapes"),
+    [
+        (None, 5, 1),
+        (None, 7, 2),
+        (1, 0.5, 1),
+        (1, 2, 2),
+    ],
+)
+def test_cached_search_expires(
+    isolated_cache,
+    scrape_calls,
+    monkeypatch,
+    hours_old,
+    elapsed_hours,
+    expected_scrapes,
+):
+    scrape_jobs_tool("engineer", site_name=["indeed"], hours_old=hours_old)
+    _advance_clock(monkeypatch, elapsed_hours * 60 * 60)
+    scrape_jobs_tool("engineer", site_name=["indeed"], hours_old=hours_old)
+
+    assert len(scrape_calls) == expected_scrapes
+
+
+def test_errors_are_not_cached(isolated_cache, scrape_calls):
+    scrape_jobs_tool("engineer", site_name=["monster"])
+
+    assert not isolated_cache.exists()
+
+
+def test_unreadable_cache_entry_is_a_miss(isolated_cache):
+    key = search_cache.make_key({"search_term": "engineer"})
+    search_cache.put(key, "listing", prune_after=60)
+    search_cache._memory.clear()
+    path = isolated_cache / f"{key}.json.gz"
+    path.write_bytes(gzip.compress(b'{"text": "listing"}')[:-8])
+
+    assert search_cache.get(key, max_age=60) is None
+    assert not path.exists()
+
+
+def test_put_prunes_stale_entries(isolated_cache):
+    search_cache.put("old", "listing", prune_after=60)
+    stale = time.time() - 120
+    os.utime(isolated_cache / "old.json.gz", (stale, stale))
+    search_cache.put("new", "listing", prune_after=60)
+
+    assert [path.name for path in isolated_cache.glob("*.json.gz")] == ["new.json.gz"]
+
+
+def test_scrape_jobs_tool_output(isolated_cache, monkeypatch):
+    jobs_df = pd.DataFrame(
+        {
+            "title": ["Senior Engineer", np.nan, "Analyst"],
+            "company": ["Acme", "Globex", np.nan],
+            "location": ["Amsterdam, NL", "Remote", "Utrecht"],
+            "site": ["linkedin", "zip_recruiter", "indeed"],
+            "job_type": ["fulltime", np.nan, np.nan],
+            "date_posted": ["2024-05-01", np.nan, np.nan],
+            "min_amount": [50000.0, 40000.0, np.nan],
+            "max_amount": [70000.0, 60000.0, np.nan],
+            "currency": [np.nan, "EUR", np.nan],
+            "interval": [np.nan, "monthly", np.nan],
+            "is_remote": [True, np.nan, False],
+            "job_url": ["https://example.com/1", np.nan, np.nan],
+            "description": ["x" * 301, "Short description.", np.nan],
+            "company_industry": ["Software", np.nan, np.nan],
+            "job_level": ["senior", np.nan, np.nan],
+            "skills": ["Python", np.nan, np.nan],
+            "experience_range": ["3-5 years", np.nan, np.nan],
+            "company_rating": [4.2, np.nan, np.nan],
+        }
+    )
+    jobspy = types.SimpleNamespace(scrape_jobs=lambda **kwargs: jobs_df)
+    monkeypatch.setitem(sys.modules, "jobspy", jobspy)
+
+    result = scrape_jobs_tool(
+        "engineer",
+        location="Netherlands",
+        site_name=["linkedin", "zip_recruiter", "indeed"],
+    )
+
+    assert result == "\n".join(
+        [
+            "Found 3 jobs for 'engineer' in Netherlands",
+            "",
+            "1. Senior Engineer",
+            "Company: Acme",
+            "Location: Amsterdam, NL",
+            "Source: Linkedin",
+            "Type: fulltime",
+            "Posted: 2024-05-01",
+            "Salary: 50,000 - 70,000 USD (yearly)",
+            "Remote work available",
+            "Apply: https://example.com/1",
+            f"Description: {'x' * 300}...",
+            "Industry: Software",
+            "Level: senior",
+            "Skills: Python",
+            "Experience: 3-5 years",
+            "Company Rating: 4.2/5",
+            "---",
+            "2. N/A",
+            "Company: Globex",
+            "Location: Remote",
+            "Source: Zip_Recruiter",
+            "Salary: 40,000 - 60,000 EUR (monthly)",
+            "Description: Short description.",
+            "---",
+            "3. Analyst",
+            "Company: N/A",
+            "Location: Utrecht",
+            "Source: Indeed",
+            "",
+            "Search Summary",
+            "Total jobs found: 3",
+            "Sites searched: linkedin, zip_recruiter, indeed",
+            "Remote jobs: 1",
+            "Jobs with salary info: 2",
+            "Average salary range: 45,000 - 65,000",
+        ]
+    )